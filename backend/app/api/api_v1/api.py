@@ -1,8 +1,9 @@
 from fastapi import APIRouter
-from app.api.api_v1.endpoints import papers, research, analytics
+from app.api.api_v1.endpoints import papers, research, analytics, graph
 
 api_router = APIRouter()
 
 api_router.include_router(papers.router, prefix="/papers", tags=["papers"])
 api_router.include_router(research.router, prefix="/research", tags=["research"])
-api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
\ No newline at end of file
+api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
+api_router.include_router(graph.router, prefix="/graph", tags=["graph"])
\ No newline at end of file
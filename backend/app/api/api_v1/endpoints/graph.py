@@ -0,0 +1,84 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app.core.database import get_db
+from app.models.research_paper import Author, MeshTerm
+from app.services.graph_service import get_graph_service
+from pydantic import BaseModel
+from datetime import datetime
+
+router = APIRouter()
+
+# Pydantic models for API
+class EntityResponse(BaseModel):
+    id: int
+    name: str
+
+class NeighbourResponse(BaseModel):
+    id: int
+    name: Optional[str]
+    count: int
+
+class AuthorPaperResponse(BaseModel):
+    id: int
+    pubmed_id: str
+    title: str
+    journal: str
+    publication_date: Optional[datetime]
+
+# Initialize services
+graph_service = get_graph_service()
+
+@router.get("/authors", response_model=EntityResponse)
+async def find_author(name: str, db: Session = Depends(get_db)):
+    """Look up an author by exact name"""
+    author = db.query(Author).filter(Author.name == name).first()
+
+    if not author:
+        raise HTTPException(status_code=404, detail="Author not found")
+
+    return EntityResponse(id=author.id, name=author.name)
+
+# Plain def: refresh may reload an index from disk, so these run in the threadpool
+@router.get("/authors/{author_id}/collaborators", response_model=List[NeighbourResponse])
+def get_top_collaborators(author_id: int, limit: int = 10, db: Session = Depends(get_db)):
+    """Get the authors who most often co-author papers with the given author"""
+    graph_service.refresh()
+    return graph_service.top_collaborators(db, author_id, limit)
+
+@router.get("/authors/{author_id}/papers", response_model=List[AuthorPaperResponse])
+async def get_author_papers(
+    author_id: int,
+    skip: int = 0,
+    limit: int = 20,
+    db: Session = Depends(get_db)
+):
+    """Get papers by the given author, newest first"""
+    papers = graph_service.author_papers(db, author_id, skip, limit)
+
+    return [
+        AuthorPaperResponse(
+            id=paper.id,
+            pubmed_id=paper.pubmed_id,
+            title=paper.title,
+            journal=paper.journal or "",
+            publication_date=paper.publication_date
+        )
+        for paper in papers
+    ]
+
+@router.get("/mesh-terms", response_model=EntityResponse)
+async def find_mesh_term(name: str, db: Session = Depends(get_db)):
+    """Look up a MeSH term by exact name"""
+    mesh_term = db.query(MeshTerm).filter(MeshTerm.name == name).first()
+
+    if not mesh_term:
+        raise HTTPException(status_code=404, detail="MeSH term not found")
+
+    return EntityResponse(id=mesh_term.id, name=mesh_term.name)
+
+@router.get("/mesh-terms/{mesh_term_id}/related", response_model=List[NeighbourResponse])
+def get_related_mesh_terms(mesh_term_id: int, limit: int = 10, db: Session = Depends(get_db)):
+    """Get the MeSH terms that most often appear on papers with the given term"""
+    graph_service.refresh()
+    return graph_service.related_mesh_terms(db, mesh_term_id, limit)
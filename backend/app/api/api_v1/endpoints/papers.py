@@ -1,10 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, aliased
 from typing import List, Optional
 from app.core.database import get_db
 from app.models.research_paper import ResearchPaper
 from app.services.pubmed_service import PubMedService
-from app.services.ml_service import MLService
+from app.services.ml_service import MLService, get_ml_service
+from app.services.graph_service import GraphBatch, get_graph_service
+from app.services.dedup_service import DedupBatch, DeduplicationService
+from app.core.config import settings
 from pydantic import BaseModel
 from datetime import datetime
 
@@ -24,13 +27,29 @@ class PaperResponse(BaseModel):
     sentiment_score: Optional[int]
     complexity_score: Optional[int]
 
+class DuplicateResponse(BaseModel):
+    id: int
+    pubmed_id: str
+    title: str
+    duplicate_of_id: int
+    duplicate_of_pubmed_id: str
+    duplicate_of_title: str
+    similarity: float
+
 class SearchRequest(BaseModel):
     query: str
     max_results: int = 100
 
 # Initialize services
 pubmed_service = PubMedService()
-ml_service = MLService()
+graph_service = get_graph_service()
+dedup_service = DeduplicationService(
+    settings.DEDUP_INDEX_PATH,
+    settings.DEDUP_NUM_PERM,
+    settings.DEDUP_BANDS,
+    settings.DEDUP_THRESHOLD,
+    settings.DEDUP_MIN_SHINGLES
+)
 
 @router.get("/", response_model=List[PaperResponse])
 async def get_papers(
@@ -85,7 +104,16 @@ async def search_and_import_papers(
 
 def process_new_papers(query: str, max_results: int, db: Session):
     """Background task to search and process papers"""
+    ml_service = get_ml_service()
+    # Index updates of this call only, persisted once its transaction commits
+    graph_batch = GraphBatch()
+    dedup_batch = DedupBatch()
+    
     try:
+        # Pick up index updates persisted by other workers and scripts
+        graph_service.refresh()
+        dedup_service.refresh()
+        
         # Search PubMed
         pmids = pubmed_service.search_papers(query, max_results)
         
@@ -116,19 +144,28 @@ def process_new_papers(query: str, max_results: int, db: Session):
                 mesh_terms=paper_data["mesh_terms"]
             )
             
-            # Process with ML if abstract exists
-            if paper_data["abstract"]:
-                paper.summary = ml_service.generate_summary(paper_data["abstract"])
-                sentiment = ml_service.analyze_sentiment(paper_data["abstract"])
-                paper.sentiment_score = sentiment["score"]
-                paper.complexity_score = ml_service.calculate_complexity_score(
-                    paper_data["abstract"]
-                )
-                paper.is_processed = True
+            # Near-duplicates of stored papers (preprints, errata, republished
+            # abstracts) are recorded but skip inference and indexing
+            signature = dedup_service.signature(paper_data)
+            duplicate = dedup_service.find_duplicate(signature, dedup_batch)
+            
+            if duplicate:
+                paper.duplicate_of_id, paper.duplicate_similarity = duplicate
+                db.add(paper)
+                continue
+            
+            # Process with ML
+            enrich_paper(ml_service, paper)
             
             db.add(paper)
+            graph_service.link_paper(
+                db, paper, paper_data["authors"], paper_data["mesh_terms"], graph_batch
+            )
+            dedup_service.add(dedup_batch, paper.id, signature)
         
         db.commit()
+        graph_service.flush(graph_batch)
+        dedup_service.flush(dedup_batch)
         
         # Extract themes from all papers
         update_global_themes(db)
@@ -137,20 +174,50 @@ def process_new_papers(query: str, max_results: int, db: Session):
         print(f"Error processing papers: {e}")
         db.rollback()
 
+def enrich_paper(ml_service: MLService, paper: ResearchPaper):
+    """Fill a new paper's AI-generated fields, stamping each with its model version.
+    
+    A field whose inference fails is left empty and unstamped, so reprocessing
+    picks it up later. Papers without an abstract have nothing to enrich; they
+    are stamped so reprocessing does not pick them up.
+    """
+    abstract = paper.abstract
+    
+    try:
+        paper.summary = ml_service.generate_summaries([abstract])[0] if abstract else None
+        paper.summary_version = MLService.SUMMARY_VERSION
+    except Exception as e:
+        print(f"Error summarizing paper {paper.pubmed_id}: {e}")
+    
+    try:
+        paper.sentiment_score = ml_service.analyze_sentiments([abstract])[0]["score"] if abstract else None
+        paper.sentiment_version = MLService.SENTIMENT_VERSION
+    except Exception as e:
+        print(f"Error analyzing sentiment of paper {paper.pubmed_id}: {e}")
+    
+    try:
+        paper.complexity_score = ml_service.calculate_complexity_scores([abstract])[0] if abstract else None
+        paper.complexity_version = MLService.COMPLEXITY_VERSION
+    except Exception as e:
+        print(f"Error scoring complexity of paper {paper.pubmed_id}: {e}")
+    
+    paper.is_processed = True
+
 def update_global_themes(db: Session):
     """Update global themes based on all papers"""
     try:
         # Get all processed papers
         papers = db.query(ResearchPaper).filter(
             ResearchPaper.is_processed == True,
-            ResearchPaper.abstract.isnot(None)
+            ResearchPaper.abstract.isnot(None),
+            ResearchPaper.duplicate_of_id.is_(None)
         ).all()
         
         if len(papers) < 5:
             return
         
         abstracts = [paper.abstract for paper in papers]
-        themes = ml_service.extract_themes(abstracts, n_themes=20)
+        themes = get_ml_service().extract_themes(abstracts, n_themes=20)
         
         # Update papers with theme information
         for paper in papers:
@@ -170,6 +237,27 @@ def update_global_themes(db: Session):
         print(f"Error updating themes: {e}")
         db.rollback()
 
+@router.get("/duplicates", response_model=List[DuplicateResponse])
+async def get_duplicates(skip: int = 0, limit: int = 20, db: Session = Depends(get_db)):
+    """Get papers flagged as near-duplicates of an earlier paper"""
+    original = aliased(ResearchPaper)
+    rows = db.query(ResearchPaper, original).join(
+        original, ResearchPaper.duplicate_of_id == original.id
+    ).order_by(ResearchPaper.id).offset(skip).limit(limit).all()
+    
+    return [
+        DuplicateResponse(
+            id=paper.id,
+            pubmed_id=paper.pubmed_id,
+            title=paper.title,
+            duplicate_of_id=original_paper.id,
+            duplicate_of_pubmed_id=original_paper.pubmed_id,
+            duplicate_of_title=original_paper.title,
+            similarity=paper.duplicate_similarity
+        )
+        for paper, original_paper in rows
+    ]
+
 @router.get("/{paper_id}", response_model=PaperResponse)
 async def get_paper(paper_id: int, db: Session = Depends(get_db)):
     """Get a specific paper by ID"""
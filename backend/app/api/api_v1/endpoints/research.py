@@ -1,10 +1,8 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from app.core.database import get_db
-from app.services.ml_service import MLService
 
 router = APIRouter()
-ml_service = MLService()
 
 @router.get("/themes")
 async def get_research_themes(db: Session = Depends(get_db)):
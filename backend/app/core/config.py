@@ -13,6 +13,31 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = "OpenMND"
     PROJECT_DESCRIPTION: str = "Open Motor Neuron Disease Research Intelligence Platform"
     VERSION: str = "1.0.0"
+
+    # Reprocessing settings
+    REPROCESS_CHUNK_SIZE: int = 500
+    REPROCESS_BATCH_SIZE: int = 16
+    REPROCESS_MAX_WORKERS: int = 2
+    REPROCESS_CHECKPOINT_PATH: str = "reprocess_checkpoint.json"
+
+    # Topic modeling settings (scalable mode)
+    TOPIC_SCALABLE_MIN_DOCS: int = 5000
+    TOPIC_CHUNK_SIZE: int = 2000
+    TOPIC_N_FEATURES: int = 2 ** 18
+    TOPIC_PROCESSES: Optional[int] = None  # None uses all available cores
+    TOPIC_N_JOBS: int = -1
+    TOPIC_BATCH_SIZE: int = 256
+
+    # Co-occurrence graph index settings
+    GRAPH_INDEX_DIR: str = "data/graph"
+    GRAPH_TOP_K: int = 50
+
+    # Near-duplicate detection settings
+    DEDUP_INDEX_PATH: str = "data/dedup/minhash.npz"
+    DEDUP_NUM_PERM: int = 128
+    DEDUP_BANDS: int = 32
+    DEDUP_THRESHOLD: float = 0.8
+    DEDUP_MIN_SHINGLES: int = 10  # Shorter abstracts are not checked
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,26 @@
+import fcntl
+import os
+from contextlib import contextmanager
+from typing import Optional, Tuple
+
+@contextmanager
+def file_lock(path: str):
+    """Hold an exclusive lock on path across processes, via a sibling .lock file"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    with open(f"{path}.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def file_version(path: str) -> Optional[Tuple[int, int]]:
+    """Identify the current version of a file that is replaced with os.replace"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    # A replaced file gets a new inode, so this changes even within one mtime tick
+    return stat.st_ino, stat.st_mtime_ns
@@ -0,0 +1,53 @@
+import asyncio
+import os
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from app.core.config import settings
+from app.api.api_v1.api import api_router
+from app.services.ml_service import get_ml_service
+
+app = FastAPI(
+    title=settings.PROJECT_NAME,
+    description=settings.PROJECT_DESCRIPTION,
+    version=settings.VERSION
+)
+
+# Configure CORS
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["http://localhost:3000"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+app.include_router(api_router, prefix="/api/v1")
+
+@app.on_event("startup")
+async def warm_up_models():
+    # Load (unless preloaded) and warm up in the background so health checks
+    # are answered meanwhile
+    asyncio.get_running_loop().run_in_executor(None, lambda: get_ml_service().warm_up())
+
+@app.get("/")
+async def root():
+    return {
+        "message": f"Welcome to {settings.PROJECT_NAME} API",
+        "description": settings.PROJECT_DESCRIPTION,
+        "version": settings.VERSION
+    }
+
+@app.get("/health")
+async def health():
+    """Readiness check - returns 503 until this worker's models are warm"""
+    ml_service = get_ml_service(load=False)
+    models_warm = ml_service is not None and ml_service.is_warm
+    return JSONResponse(
+        status_code=200 if models_warm else 503,
+        content={
+            "status": "ready" if models_warm else "warming",
+            "models_warm": models_warm,
+            "pid": os.getpid()
+        }
+    )
@@ -1,9 +1,25 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Boolean, Float, ForeignKey, Table
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 
 Base = declarative_base()
 
+# Association tables linking papers to normalized authors and MeSH terms
+paper_authors = Table(
+    "openmnd_paper_authors",
+    Base.metadata,
+    Column("paper_id", Integer, ForeignKey("openmnd_research_papers.id"), primary_key=True),
+    Column("author_id", Integer, ForeignKey("openmnd_authors.id"), primary_key=True, index=True),
+    Column("position", Integer)  # Author order on the paper
+)
+
+paper_mesh_terms = Table(
+    "openmnd_paper_mesh_terms",
+    Base.metadata,
+    Column("paper_id", Integer, ForeignKey("openmnd_research_papers.id"), primary_key=True),
+    Column("mesh_term_id", Integer, ForeignKey("openmnd_mesh_terms.id"), primary_key=True, index=True)
+)
+
 class ResearchPaper(Base):
     __tablename__ = "openmnd_research_papers"  # Updated table name
 
@@ -25,6 +41,15 @@ class ResearchPaper(Base):
     sentiment_score = Column(Integer)  # Research optimism score
     complexity_score = Column(Integer)  # 1-10 complexity rating
 
+    # Enrichment versions - which model produced each AI-generated field
+    summary_version = Column(String, index=True)
+    sentiment_version = Column(String, index=True)
+    complexity_version = Column(String, index=True)
+
+    # Near-duplicate detection - set when the paper matches an earlier one
+    duplicate_of_id = Column(Integer, ForeignKey("openmnd_research_papers.id"), index=True)
+    duplicate_similarity = Column(Float)  # Estimated Jaccard similarity
+
     # Metadata
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, onupdate=func.now())
@@ -39,3 +64,15 @@ class ResearchTheme(Base):
     paper_count = Column(Integer, default=0)
     trend_direction = Column(String)  # 'increasing', 'decreasing', 'stable'
     created_at = Column(DateTime, server_default=func.now())
+
+class Author(Base):
+    __tablename__ = "openmnd_authors"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, nullable=False, index=True)
+
+class MeshTerm(Base):
+    __tablename__ = "openmnd_mesh_terms"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, nullable=False, index=True)
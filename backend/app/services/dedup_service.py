@@ -0,0 +1,266 @@
+import os
+import threading
+import zlib
+import numpy as np
+from sqlalchemy.orm import Session
+from typing import List, Tuple, Optional
+from app.core.file_lock import file_lock, file_version
+from app.models.research_paper import ResearchPaper
+from app.services.ml_service import MLService
+
+# Bump when signatures change meaning, so persisted ones are not mixed with new ones
+_SIGNATURE_SCHEME = 3
+_HASH_SHIFT = np.uint64(32)
+_BAND_MULTIPLIER = np.uint64(0x100000001B3)  # FNV-1a 64-bit prime
+
+class DedupBatch:
+    """Signatures from one ingestion transaction, searched by it and merged once it commits"""
+
+    def __init__(self):
+        self.ids: List[int] = []
+        self.signatures: List[np.ndarray] = []
+
+    def add(self, paper_id: int, signature: Optional[np.ndarray]):
+        if signature is not None:
+            self.ids.append(paper_id)
+            self.signatures.append(signature)
+
+
+class MinHashIndex:
+    """MinHash signatures with banded LSH lookup for near-duplicate detection.
+
+    Signatures live in a single (n_papers, num_perm) uint32 array. For lookups each
+    band's keys are kept sorted, so finding candidates is a binary search per band.
+    Several processes may share the file: writers merge into the latest version on
+    disk under a file lock, and readers reload it when it changes. Within a process,
+    the arrays are swapped and read under a thread lock.
+    """
+
+    def __init__(self, path: str, num_perm: int = 128, bands: int = 32,
+                 threshold: float = 0.8, shingle_size: int = 3, min_shingles: int = 10,
+                 seed: int = 42):
+        if num_perm % bands != 0:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.path = path
+        self.num_perm = num_perm
+        self.bands = bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.min_shingles = min_shingles
+
+        # Multiply-add-shift hashes of 32-bit shingle hashes: ((a * x + b) mod 2^64) >> 32
+        # with random odd 64-bit a and random 64-bit b
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(0, np.iinfo(np.uint64).max, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.randint(0, np.iinfo(np.uint64).max, size=num_perm, dtype=np.uint64)
+
+        # Reentrant since merge refreshes while holding it; always taken after the file lock
+        self._lock = threading.RLock()
+        self._set_arrays(np.zeros(0, dtype=np.int64), np.zeros((0, num_perm), dtype=np.uint32))
+        self._version: Optional[Tuple[int, int]] = None
+        self.refresh()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def signature(self, text: Optional[str]) -> Optional[np.ndarray]:
+        """Compute the MinHash signature of word shingles of the preprocessed text.
+
+        Returns None for texts with fewer than min_shingles distinct shingles, which
+        are too short to tell near-duplicates from merely similar wording.
+        """
+        tokens = MLService._preprocess_text(text).lower().split()
+        k = self.shingle_size
+        shingles = {" ".join(tokens[i:i + k]) for i in range(len(tokens) - k + 1)}
+        if len(shingles) < self.min_shingles:
+            return None
+
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+            dtype=np.uint64, count=len(shingles)
+        )
+
+        # uint64 array arithmetic wraps, which is the mod 2^64
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) >> _HASH_SHIFT
+        return permuted.min(axis=1).astype(np.uint32)
+
+    def find(self, signature: Optional[np.ndarray],
+             batch: Optional[DedupBatch] = None) -> Optional[Tuple[int, float]]:
+        """Return (paper_id, estimated Jaccard similarity) of the closest match above threshold.
+
+        Papers in batch, not yet merged into the index, are searched as well.
+        """
+        if signature is None:
+            return None
+
+        with self._lock:
+            ids, signatures = self.ids, self.signatures
+            order, sorted_keys = self._order, self._sorted_keys
+
+        keys = self._band_keys(signature[None, :])[0]
+        candidates = set()
+        for band in range(self.bands):
+            lo = np.searchsorted(sorted_keys[band], keys[band], side="left")
+            hi = np.searchsorted(sorted_keys[band], keys[band], side="right")
+            candidates.update(order[band, lo:hi].tolist())
+
+        best = None
+        if candidates:
+            rows = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+            best = self._best_match(ids[rows], signatures[rows], signature)
+
+        # A batch holds one ingestion's papers, so compare them directly
+        if batch is not None and batch.ids:
+            pending = self._best_match(np.array(batch.ids), np.stack(batch.signatures), signature)
+            if pending and (best is None or pending[1] > best[1]):
+                best = pending
+
+        return best
+
+    def merge(self, batch: DedupBatch):
+        """Add a batch's signatures to the index and persist it"""
+        if not batch.ids:
+            return
+
+        batch_ids = np.array(batch.ids, dtype=np.int64)
+        batch_signatures = np.stack(batch.signatures)
+
+        with file_lock(self.path), self._lock:
+            # Merge into the latest persisted index so other writers' papers are kept
+            self.refresh()
+            self._set_arrays(
+                np.concatenate([self.ids, batch_ids]),
+                np.concatenate([self.signatures, batch_signatures])
+            )
+            self._save()
+
+    def clear(self):
+        """Empty and persist the index, e.g. before a full rebuild"""
+        with file_lock(self.path), self._lock:
+            self._set_arrays(np.zeros(0, dtype=np.int64),
+                             np.zeros((0, self.num_perm), dtype=np.uint32))
+            self._save()
+
+    def refresh(self):
+        """Reload the index if another process has persisted a newer version"""
+        with self._lock:
+            version = file_version(self.path)
+            if version is None or version == self._version:
+                return
+
+            with np.load(self.path) as data:
+                if "scheme" in data.files and int(data["scheme"]) == _SIGNATURE_SCHEME:
+                    self._set_arrays(data["ids"], data["signatures"])
+                else:
+                    print(f"Ignoring near-duplicate index {self.path} built with an older "
+                          f"signature scheme; run scripts/build_dedup_index.py to rebuild it")
+                    self._set_arrays(np.zeros(0, dtype=np.int64),
+                                     np.zeros((0, self.num_perm), dtype=np.uint32))
+            self._version = version
+
+    def _best_match(self, ids: np.ndarray, signatures: np.ndarray,
+                    signature: np.ndarray) -> Optional[Tuple[int, float]]:
+        similarities = (signatures == signature).mean(axis=1)
+        best = int(similarities.argmax())
+        if similarities[best] >= self.threshold:
+            return int(ids[best]), float(similarities[best])
+        return None
+
+    def _band_keys(self, signatures: np.ndarray) -> np.ndarray:
+        """Fold each band of each signature into one uint64 key, shape (n, bands)"""
+        rows_per_band = self.num_perm // self.bands
+        banded = signatures.reshape(len(signatures), self.bands, rows_per_band).astype(np.uint64)
+
+        keys = np.zeros((len(signatures), self.bands), dtype=np.uint64)
+        for row in range(rows_per_band):
+            keys = keys * _BAND_MULTIPLIER + banded[:, :, row]
+        return keys
+
+    def _set_arrays(self, ids: np.ndarray, signatures: np.ndarray):
+        keys = self._band_keys(signatures).T
+        order = np.argsort(keys, axis=1, kind="stable")
+        sorted_keys = np.take_along_axis(keys, order, axis=1)
+
+        with self._lock:
+            self.ids = ids
+            self.signatures = signatures
+            self._order = order
+            self._sorted_keys = sorted_keys
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+        # Write then rename so readers never load a partial file
+        tmp_path = f"{self.path}.tmp.npz"
+        np.savez(tmp_path, ids=self.ids, signatures=self.signatures,
+                 scheme=np.array(_SIGNATURE_SCHEME))
+        os.replace(tmp_path, self.path)
+        self._version = file_version(self.path)
+
+
+class DeduplicationService:
+    """Flags near-duplicate papers before they reach the ML stage"""
+
+    def __init__(self, index_path: str, num_perm: int = 128, bands: int = 32,
+                 threshold: float = 0.8, min_shingles: int = 10):
+        self.index = MinHashIndex(index_path, num_perm, bands, threshold,
+                                  min_shingles=min_shingles)
+
+    def signature(self, paper_data: dict) -> Optional[np.ndarray]:
+        """Signature of the abstract; None when it is missing or too short to compare.
+
+        Titles are not used: short generic titles match each other far too easily.
+        """
+        return self.index.signature(paper_data.get("abstract"))
+
+    def find_duplicate(self, signature: Optional[np.ndarray],
+                       batch: Optional[DedupBatch] = None) -> Optional[Tuple[int, float]]:
+        return self.index.find(signature, batch)
+
+    def add(self, batch: DedupBatch, paper_id: int, signature: Optional[np.ndarray]):
+        """Add a paper to the calling ingestion's batch; it is searchable through the batch"""
+        batch.add(paper_id, signature)
+
+    def flush(self, batch: DedupBatch):
+        """Persist a batch; call after its ingestion transaction commits.
+
+        When the transaction rolls back, drop the batch instead.
+        """
+        self.index.merge(batch)
+
+    def refresh(self):
+        self.index.refresh()
+
+    def rebuild(self, db: Session, chunk_size: int = 1000) -> int:
+        """Re-index every paper in id order, flagging near-duplicates of earlier papers"""
+        self.index.clear()
+        last_id = 0
+        flagged = 0
+
+        while True:
+            papers = db.query(ResearchPaper).filter(
+                ResearchPaper.id > last_id
+            ).order_by(ResearchPaper.id).limit(chunk_size).all()
+
+            if not papers:
+                break
+
+            batch = DedupBatch()
+            for paper in papers:
+                signature = self.signature({"abstract": paper.abstract})
+                duplicate = self.find_duplicate(signature, batch)
+
+                if duplicate:
+                    paper.duplicate_of_id, paper.duplicate_similarity = duplicate
+                    flagged += 1
+                else:
+                    paper.duplicate_of_id, paper.duplicate_similarity = None, None
+                    self.add(batch, paper.id, signature)
+
+            db.commit()
+            self.flush(batch)
+            last_id = papers[-1].id
+            print(f"Indexed papers up to id {last_id} ({flagged} duplicates flagged)")
+
+        return flagged
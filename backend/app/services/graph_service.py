@@ -0,0 +1,250 @@
+import os
+import threading
+import numpy as np
+from functools import lru_cache
+from scipy.sparse import csr_matrix, save_npz, load_npz
+from sqlalchemy import select, insert, desc
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from typing import List, Dict, Tuple, Optional
+from app.core.config import settings
+from app.core.file_lock import file_lock, file_version
+from app.models.research_paper import (
+    ResearchPaper, Author, MeshTerm, paper_authors, paper_mesh_terms
+)
+
+# INSERT ... ON CONFLICT DO NOTHING for the supported databases
+_DIALECT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+class CooccurrenceIndex:
+    """Symmetric sparse co-occurrence counts between entities, persisted as a SciPy CSR matrix.
+
+    Rows and columns are entity database ids, so a lookup is a single row slice.
+    Several processes may share the file: writers merge into the latest version on
+    disk under a file lock, and readers reload it when it changes. Within a process,
+    the matrix and neighbour cache are swapped and read under a thread lock.
+    """
+
+    def __init__(self, path: str, top_k: int = 50):
+        self.path = path
+        self.top_k = top_k
+        self.matrix = csr_matrix((0, 0), dtype=np.int32)
+        self._neighbours: Dict[int, List[Tuple[int, int]]] = {}
+        self._version: Optional[Tuple[int, int]] = None
+        # Reentrant since merge refreshes while holding it; always taken after the file lock
+        self._lock = threading.RLock()
+        self.refresh()
+
+    def refresh(self):
+        """Reload the matrix if another process has persisted a newer version"""
+        with self._lock:
+            version = file_version(self.path)
+
+            if version is not None and version != self._version:
+                self.matrix = load_npz(self.path).tocsr()
+                self._neighbours = {}
+                self._version = version
+
+    def merge(self, groups: List[List[int]]):
+        """Add per-paper entity groups to the matrix and persist it"""
+        groups = [ids for ids in (sorted(set(ids)) for ids in groups) if len(ids) > 1]
+        if not groups:
+            return
+
+        delta = self._cooccurrence(groups)
+
+        with file_lock(self.path), self._lock:
+            # Merge into the latest persisted matrix so other writers' updates are kept
+            self.refresh()
+
+            size = max(self.matrix.shape[0], delta.shape[0])
+            self.matrix.resize((size, size))
+            delta.resize((size, size))
+            self.matrix = (self.matrix + delta).tocsr()
+
+            # Only rows touched by this update need their neighbours recomputed
+            for entity_id in np.unique(delta.nonzero()[0]):
+                self._neighbours.pop(int(entity_id), None)
+
+            self._save()
+
+    def rebuild(self, groups: List[List[int]]):
+        """Replace the matrix with one built from scratch from per-paper entity groups"""
+        matrix = self._cooccurrence([sorted(set(ids)) for ids in groups])
+
+        with file_lock(self.path), self._lock:
+            self.matrix = matrix
+            self._neighbours = {}
+            self._save()
+
+    def neighbours(self, entity_id: int, limit: int = 10) -> List[Tuple[int, int]]:
+        """Return (entity_id, count) pairs for the entities most often seen with entity_id"""
+        with self._lock:
+            if entity_id not in self._neighbours:
+                self._neighbours[entity_id] = self._top_neighbours(entity_id)
+            return self._neighbours[entity_id][:limit]
+
+    def _top_neighbours(self, entity_id: int) -> List[Tuple[int, int]]:
+        if entity_id < 0 or entity_id >= self.matrix.shape[0]:
+            return []
+
+        start, end = self.matrix.indptr[entity_id], self.matrix.indptr[entity_id + 1]
+        ids = self.matrix.indices[start:end]
+        counts = self.matrix.data[start:end]
+
+        order = np.argsort(-counts, kind="stable")[:self.top_k]
+        return [(int(ids[i]), int(counts[i])) for i in order]
+
+    def _cooccurrence(self, groups: List[List[int]]) -> csr_matrix:
+        """Build pairwise counts as incidence.T @ incidence with the diagonal removed"""
+        rows = np.repeat(np.arange(len(groups)), [len(ids) for ids in groups])
+        cols = np.fromiter((i for ids in groups for i in ids), dtype=np.int64, count=len(rows))
+        size = int(cols.max()) + 1 if len(cols) else 0
+
+        incidence = csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+            shape=(len(groups), size)
+        )
+        cooccurrence = (incidence.T @ incidence).tocsr()
+        cooccurrence.setdiag(0)
+        cooccurrence.eliminate_zeros()
+        return cooccurrence
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+        # Write then rename so readers never load a partial file
+        tmp_path = f"{self.path}.tmp.npz"
+        save_npz(tmp_path, self.matrix)
+        os.replace(tmp_path, self.path)
+        self._version = file_version(self.path)
+
+
+class GraphBatch:
+    """Index updates from one ingestion transaction, merged once it commits"""
+
+    def __init__(self):
+        self.author_groups: List[List[int]] = []
+        self.mesh_groups: List[List[int]] = []
+
+
+class GraphService:
+    """Normalized author / MeSH term storage backed by co-occurrence indexes"""
+
+    def __init__(self, index_dir: str, top_k: int = 50):
+        self.author_index = CooccurrenceIndex(
+            os.path.join(index_dir, "author_cooccurrence.npz"), top_k
+        )
+        self.mesh_index = CooccurrenceIndex(
+            os.path.join(index_dir, "mesh_cooccurrence.npz"), top_k
+        )
+
+    def link_paper(self, db: Session, paper: ResearchPaper, authors: List[str],
+                   mesh_terms: List[str], batch: GraphBatch):
+        """Store a paper's authors and MeSH terms in the normalized tables and add its index updates to batch"""
+        # Paper id is needed for the association rows
+        db.flush()
+
+        author_ids = self._get_or_create_ids(db, Author, authors)
+        if author_ids:
+            db.execute(insert(paper_authors), [
+                {"paper_id": paper.id, "author_id": author_id, "position": position}
+                for position, author_id in enumerate(author_ids)
+            ])
+            batch.author_groups.append(author_ids)
+
+        mesh_ids = self._get_or_create_ids(db, MeshTerm, mesh_terms)
+        if mesh_ids:
+            db.execute(insert(paper_mesh_terms), [
+                {"paper_id": paper.id, "mesh_term_id": mesh_id} for mesh_id in mesh_ids
+            ])
+            batch.mesh_groups.append(mesh_ids)
+
+    def flush(self, batch: GraphBatch):
+        """Persist a batch's index updates; call after its ingestion transaction commits.
+
+        When the transaction rolls back, drop the batch instead.
+        """
+        self.author_index.merge(batch.author_groups)
+        self.mesh_index.merge(batch.mesh_groups)
+
+    def refresh(self):
+        self.author_index.refresh()
+        self.mesh_index.refresh()
+
+    def rebuild(self, db: Session):
+        """Rebuild both indexes from the association tables, leaving out near-duplicate papers"""
+        self.author_index.rebuild(self._groups(db, paper_authors.c.author_id, paper_authors))
+        self.mesh_index.rebuild(self._groups(db, paper_mesh_terms.c.mesh_term_id, paper_mesh_terms))
+
+    def top_collaborators(self, db: Session, author_id: int, limit: int = 10) -> List[Dict]:
+        return self._named_neighbours(db, Author, self.author_index, author_id, limit)
+
+    def related_mesh_terms(self, db: Session, mesh_term_id: int, limit: int = 10) -> List[Dict]:
+        return self._named_neighbours(db, MeshTerm, self.mesh_index, mesh_term_id, limit)
+
+    def author_papers(self, db: Session, author_id: int, skip: int = 0,
+                      limit: int = 20) -> List[ResearchPaper]:
+        return db.query(ResearchPaper).join(
+            paper_authors, paper_authors.c.paper_id == ResearchPaper.id
+        ).filter(
+            paper_authors.c.author_id == author_id,
+            ResearchPaper.duplicate_of_id.is_(None)
+        ).order_by(
+            desc(ResearchPaper.publication_date), ResearchPaper.id
+        ).offset(skip).limit(limit).all()
+
+    def _named_neighbours(self, db: Session, model, index: CooccurrenceIndex,
+                          entity_id: int, limit: int) -> List[Dict]:
+        neighbours = index.neighbours(entity_id, limit)
+        if not neighbours:
+            return []
+
+        ids = [neighbour_id for neighbour_id, _ in neighbours]
+        names = dict(db.query(model.id, model.name).filter(model.id.in_(ids)).all())
+
+        return [
+            {"id": neighbour_id, "name": names.get(neighbour_id), "count": count}
+            for neighbour_id, count in neighbours
+        ]
+
+    def _get_or_create_ids(self, db: Session, model, names: List[str]) -> List[int]:
+        """Return ids for names in their original order, creating missing rows"""
+        names = list(dict.fromkeys(name.strip() for name in names or [] if name and name.strip()))
+        if not names:
+            return []
+
+        existing = dict(db.query(model.name, model.id).filter(model.name.in_(names)).all())
+
+        # Sorted so concurrent ingestions lock new names in the same order
+        missing = sorted(name for name in names if name not in existing)
+        if missing:
+            # Another ingestion may insert the same names concurrently: skip those rows,
+            # then read back the ids of every missing name, whoever inserted it
+            dialect_insert = _DIALECT_INSERTS[db.get_bind().dialect.name]
+            db.execute(
+                dialect_insert(model.__table__)
+                .values([{"name": name} for name in missing])
+                .on_conflict_do_nothing(index_elements=["name"])
+            )
+            existing.update(db.query(model.name, model.id).filter(model.name.in_(missing)).all())
+
+        return [existing[name] for name in names]
+
+    def _groups(self, db: Session, entity_column, table) -> List[List[int]]:
+        # Papers flagged as duplicates after being linked must not count twice
+        rows = db.execute(
+            select(table.c.paper_id, entity_column)
+            .join(ResearchPaper, ResearchPaper.id == table.c.paper_id)
+            .where(ResearchPaper.duplicate_of_id.is_(None))
+        )
+
+        groups: Dict[int, List[int]] = {}
+        for paper_id, entity_id in rows:
+            groups.setdefault(paper_id, []).append(entity_id)
+        return list(groups.values())
+
+@lru_cache(maxsize=None)
+def get_graph_service() -> GraphService:
+    """Shared GraphService for the process, so each index is only held once"""
+    return GraphService(settings.GRAPH_INDEX_DIR, settings.GRAPH_TOP_K)
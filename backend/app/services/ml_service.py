@@ -1,13 +1,22 @@
 import spacy
 from transformers import pipeline, AutoTokenizer, AutoModel
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import TfidfVectorizer, TfidfTransformer
 from sklearn.cluster import KMeans
 from sklearn.decomposition import LatentDirichletAllocation
+from concurrent.futures import ProcessPoolExecutor
+from app.core.config import settings
+from app.services.topic_chunks import preprocess_text, vectorize_chunk, merge_feature_terms, stack_csr
+import multiprocessing
 import numpy as np
-from typing import List, Dict, Tuple
-import re
+from typing import List, Dict, Tuple, Optional
+import threading
 
 class MLService:
+    # Enrichment versions - bump when the model or scoring behind a field changes
+    SUMMARY_VERSION = "bart-large-cnn-v1"
+    SENTIMENT_VERSION = "twitter-roberta-sentiment-v1"
+    COMPLEXITY_VERSION = "spacy-complexity-v1"
+
     def __init__(self):
         # Load spaCy model for NLP
         self.nlp = spacy.load("en_core_web_sm")
@@ -21,6 +30,9 @@ class MLService:
                                          model="cardiffnlp/twitter-roberta-base-sentiment-latest",
                                          device=-1)
         
+        # Set once warm_up has run the models in this process
+        self.is_warm = False
+        
         # Initialize topic modeling components
         self.vectorizer = TfidfVectorizer(
             max_features=1000,
@@ -28,10 +40,28 @@ class MLService:
             ngram_range=(1, 2)
         )
         
+    def warm_up(self):
+        """Run each model once so the first request does not pay one-off initialisation costs"""
+        sample = ("Riluzole modestly extends survival in amyotrophic lateral sclerosis, "
+                  "the most common form of motor neuron disease, in randomised trials.")
+        
+        try:
+            self.summarizer(sample, max_length=30, min_length=5, do_sample=False)
+            self.sentiment_analyzer(sample)
+            self.nlp(sample)
+            self.is_warm = True
+            
+        except Exception as e:
+            print(f"Error warming up models: {e}")
+    
     def extract_themes(self, texts: List[str], n_themes: int = 10) -> List[Dict]:
         """Extract main themes from a collection of texts using topic modeling"""
         if not texts:
             return []
+        
+        # Large corpora use the parallel hashing + online LDA mode
+        if len(texts) >= settings.TOPIC_SCALABLE_MIN_DOCS:
+            return self.extract_themes_scalable(texts, n_themes)
             
         # Preprocess texts
         processed_texts = [self._preprocess_text(text) for text in texts]
@@ -71,6 +101,62 @@ class MLService:
         
         return sorted(themes, key=lambda x: x["weight"], reverse=True)
     
+    def extract_themes_scalable(self, texts: List[str], n_themes: int = 10) -> List[Dict]:
+        """Extract themes from a large corpus using parallel hashing vectorization and online LDA"""
+        if not texts:
+            return []
+        
+        chunk_size = settings.TOPIC_CHUNK_SIZE
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        n_features = settings.TOPIC_N_FEATURES
+        
+        # Preprocess and hash each chunk in a worker process - the hashing trick
+        # needs no shared vocabulary, so chunks are fully independent
+        chunk_results = _map_chunks(vectorize_chunk, chunks, [n_features] * len(chunks))
+        
+        counts_matrix = stack_csr([matrix for matrix, _ in chunk_results], n_features)
+        feature_terms = [terms for _, terms in chunk_results]
+        del chunk_results
+        
+        if counts_matrix.shape[0] < 2:
+            return []
+        
+        tfidf = TfidfTransformer()
+        tfidf.fit(counts_matrix)
+        tfidf_matrix = tfidf.transform(counts_matrix, copy=False)
+        
+        # Online (minibatch) LDA, with E-steps spread over n_jobs cores
+        lda = LatentDirichletAllocation(
+            n_components=n_themes,
+            learning_method="online",
+            batch_size=settings.TOPIC_BATCH_SIZE,
+            n_jobs=settings.TOPIC_N_JOBS,
+            random_state=42,
+            max_iter=10
+        )
+        lda.fit(tfidf_matrix)
+        
+        top_indices = [topic.argsort()[-10:][::-1] for topic in lda.components_]
+        
+        # Hashed features have no names; use the most frequent term recorded
+        # for each feature index while the chunks were vectorized
+        feature_names = merge_feature_terms(feature_terms)
+        
+        themes = []
+        for topic_idx, topic in enumerate(lda.components_):
+            top_words = [feature_names[i] for i in top_indices[topic_idx] if i in feature_names]
+            
+            # Create theme name from top words
+            theme_name = ", ".join(top_words[:3])
+            
+            themes.append({
+                "name": theme_name,
+                "keywords": top_words,
+                "weight": float(topic.sum())
+            })
+        
+        return sorted(themes, key=lambda x: x["weight"], reverse=True)
+    
     def generate_summary(self, text: str, max_length: int = 150) -> str:
         """Generate a summary of the given text"""
         if not text or len(text) < 100:
@@ -97,6 +183,34 @@ class MLService:
             print(f"Error generating summary: {e}")
             return text[:200] + "..." if len(text) > 200 else text
     
+    def generate_summaries(self, texts: List[str], max_length: int = 150,
+                           batch_size: int = 16) -> List[str]:
+        """Generate summaries for a batch of texts in a single pipeline call.
+        
+        Unlike generate_summary, inference errors are raised rather than replaced
+        with fallback text, so callers can retry the batch.
+        """
+        summaries = list(texts)
+        to_summarize = [i for i, text in enumerate(texts) if text and len(text) >= 100]
+        
+        if not to_summarize:
+            return summaries
+        
+        # Clean and truncate each text as in generate_summary
+        clean_texts = [self._preprocess_text(texts[i])[:1024] for i in to_summarize]
+        
+        results = self.summarizer(
+            clean_texts,
+            max_length=max_length,
+            min_length=30,
+            do_sample=False,
+            batch_size=batch_size
+        )
+        for i, result in zip(to_summarize, results):
+            summaries[i] = result["summary_text"]
+        
+        return summaries
+    
     def analyze_sentiment(self, text: str) -> Dict:
         """Analyze sentiment of text and return optimism score"""
         if not text:
@@ -104,35 +218,71 @@ class MLService:
         
         try:
             result = self.sentiment_analyzer(text[:512])  # Truncate for model limits
-            
-            # Convert to optimism score (1-10 scale)
-            label = result[0]["label"].lower()
-            confidence = result[0]["score"]
-            
-            if "positive" in label:
-                score = int(5 + (confidence * 5))  # 6-10 range
-            elif "negative" in label:
-                score = int(5 - (confidence * 4))  # 1-4 range
-            else:
-                score = 5  # neutral
-            
-            return {
-                "score": max(1, min(10, score)),
-                "label": label,
-                "confidence": confidence
-            }
+            return self._to_optimism_score(result[0])
             
         except Exception as e:
             print(f"Error analyzing sentiment: {e}")
             return {"score": 5, "label": "neutral"}
     
+    def analyze_sentiments(self, texts: List[str], batch_size: int = 16) -> List[Dict]:
+        """Analyze sentiment for a batch of texts in a single pipeline call.
+        
+        Unlike analyze_sentiment, inference errors are raised rather than replaced
+        with a neutral score, so callers can retry the batch.
+        """
+        sentiments = [{"score": 0, "label": "neutral"} for _ in texts]
+        to_analyze = [i for i, text in enumerate(texts) if text]
+        
+        if not to_analyze:
+            return sentiments
+        
+        results = self.sentiment_analyzer(
+            [texts[i][:512] for i in to_analyze],  # Truncate for model limits
+            batch_size=batch_size
+        )
+        for i, result in zip(to_analyze, results):
+            sentiments[i] = self._to_optimism_score(result)
+        
+        return sentiments
+    
+    def _to_optimism_score(self, result: Dict) -> Dict:
+        """Convert a sentiment pipeline result to an optimism score (1-10 scale)"""
+        label = result["label"].lower()
+        confidence = result["score"]
+        
+        if "positive" in label:
+            score = int(5 + (confidence * 5))  # 6-10 range
+        elif "negative" in label:
+            score = int(5 - (confidence * 4))  # 1-4 range
+        else:
+            score = 5  # neutral
+        
+        return {
+            "score": max(1, min(10, score)),
+            "label": label,
+            "confidence": confidence
+        }
+    
     def calculate_complexity_score(self, text: str) -> int:
         """Calculate text complexity score (1-10)"""
         if not text:
             return 1
         
-        doc = self.nlp(text)
+        return self._complexity_from_doc(self.nlp(text))
+    
+    def calculate_complexity_scores(self, texts: List[str], batch_size: int = 16) -> List[int]:
+        """Calculate complexity scores for a batch of texts using spaCy's nlp.pipe"""
+        scores = [1] * len(texts)
+        to_score = [i for i, text in enumerate(texts) if text]
         
+        docs = self.nlp.pipe((texts[i] for i in to_score), batch_size=batch_size)
+        for i, doc in zip(to_score, docs):
+            scores[i] = self._complexity_from_doc(doc)
+        
+        return scores
+    
+    def _complexity_from_doc(self, doc) -> int:
+        """Combine complexity metrics of a parsed spaCy doc into a score (1-10)"""
         # Various complexity metrics
         avg_sentence_length = np.mean([len(sent.text.split()) for sent in doc.sents])
         unique_words = len(set([token.lemma_.lower() for token in doc if token.is_alpha]))
@@ -176,17 +326,10 @@ class MLService:
         
         return entities
     
-    def _preprocess_text(self, text: str) -> str:
+    @staticmethod
+    def _preprocess_text(text: str) -> str:
         """Clean and preprocess text for analysis"""
-        if not text:
-            return ""
-        
-        # Remove special characters and normalize whitespace
-        text = re.sub(r'[^\w\s\.]', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        
-        return text
+        return preprocess_text(text)
     
     def identify_research_gaps(self, papers: List[Dict]) -> List[Dict]:
         """Identify potential research gaps based on paper analysis"""
@@ -212,3 +355,32 @@ class MLService:
             })
         
         return gaps
+
+
+_ml_service: Optional[MLService] = None
+_ml_service_lock = threading.Lock()
+
+def get_ml_service(load: bool = True) -> Optional[MLService]:
+    """Shared MLService for the process, so the models are only loaded once.
+    
+    The models are loaded on first use; with load=False this returns None
+    instead of loading them.
+    """
+    global _ml_service
+    if _ml_service is None and load:
+        with _ml_service_lock:
+            if _ml_service is None:
+                _ml_service = MLService()
+    return _ml_service
+
+def _map_chunks(func, *iterables) -> list:
+    """Map func over chunks in a process pool, or in-process when limited to one process"""
+    if settings.TOPIC_PROCESSES == 1:
+        return list(map(func, *iterables))
+    
+    # Spawn rather than fork: forking would copy a running server process, models
+    # and torch threads included. The workers live in topic_chunks, which imports
+    # nothing else from the app
+    with ProcessPoolExecutor(max_workers=settings.TOPIC_PROCESSES,
+                             mp_context=multiprocessing.get_context("spawn")) as executor:
+        return list(executor.map(func, *iterables))
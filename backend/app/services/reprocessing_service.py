@@ -0,0 +1,157 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.models.research_paper import ResearchPaper
+from app.services.ml_service import MLService
+
+
+class ReprocessingService:
+    """Re-enrich papers whose AI-generated fields were produced by an older model version"""
+
+    def __init__(self, ml_service: Optional[MLService], chunk_size: int = 500, batch_size: int = 16,
+                 max_workers: int = 2, checkpoint_path: Optional[str] = None):
+        self.ml_service = ml_service
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.checkpoint_path = checkpoint_path
+
+    @property
+    def versions(self) -> Dict[str, str]:
+        return {
+            "summary": MLService.SUMMARY_VERSION,
+            "sentiment": MLService.SENTIMENT_VERSION,
+            "complexity": MLService.COMPLEXITY_VERSION
+        }
+
+    def _stale_filter(self):
+        """SQL condition matching non-duplicate papers with at least one out-of-date field"""
+        return and_(ResearchPaper.duplicate_of_id.is_(None), or_(
+            ResearchPaper.summary_version.is_(None),
+            ResearchPaper.summary_version != MLService.SUMMARY_VERSION,
+            ResearchPaper.sentiment_version.is_(None),
+            ResearchPaper.sentiment_version != MLService.SENTIMENT_VERSION,
+            ResearchPaper.complexity_version.is_(None),
+            ResearchPaper.complexity_version != MLService.COMPLEXITY_VERSION
+        ))
+
+    def count_stale(self, db: Session) -> int:
+        """Count papers that still need reprocessing"""
+        return db.query(ResearchPaper).filter(self._stale_filter()).count()
+
+    def run(self, db: Session, resume: bool = True) -> Dict:
+        """Reprocess all stale papers in keyset-ordered chunks, checkpointing after each chunk"""
+        last_id = self._load_checkpoint() if resume else 0
+        processed = 0
+
+        while True:
+            papers = db.query(ResearchPaper).filter(
+                ResearchPaper.id > last_id,
+                self._stale_filter()
+            ).order_by(ResearchPaper.id).limit(self.chunk_size).all()
+
+            if not papers:
+                break
+
+            try:
+                self._process_chunk(papers)
+                db.commit()
+            except Exception as e:
+                print(f"Error reprocessing papers after id {last_id}: {e}")
+                db.rollback()
+                raise
+
+            last_id = papers[-1].id
+            processed += len(papers)
+            self._save_checkpoint(last_id)
+            print(f"Reprocessed {processed} papers (last id {last_id})")
+
+        self._clear_checkpoint()
+        return {"processed": processed, "last_id": last_id}
+
+    def _process_chunk(self, papers: List[ResearchPaper]):
+        """Run batched inference for each stale field of a chunk of papers"""
+        summary_papers = [p for p in papers if p.summary_version != MLService.SUMMARY_VERSION]
+        sentiment_papers = [p for p in papers if p.sentiment_version != MLService.SENTIMENT_VERSION]
+        complexity_papers = [p for p in papers if p.complexity_version != MLService.COMPLEXITY_VERSION]
+
+        # Each field runs on its own worker; models release the GIL during inference.
+        # Inference errors propagate from result() so the chunk is rolled back with
+        # no versions stamped, and a rerun resumes from the last checkpoint
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            summaries = executor.submit(
+                self.ml_service.generate_summaries,
+                self._abstracts(summary_papers),
+                batch_size=self.batch_size
+            )
+            sentiments = executor.submit(
+                self.ml_service.analyze_sentiments,
+                self._abstracts(sentiment_papers),
+                batch_size=self.batch_size
+            )
+            complexities = executor.submit(
+                self.ml_service.calculate_complexity_scores,
+                self._abstracts(complexity_papers),
+                batch_size=self.batch_size
+            )
+
+            summary_results = summaries.result()
+            sentiment_results = sentiments.result()
+            complexity_results = complexities.result()
+
+        # Papers without an abstract have nothing to enrich, but are stamped so they
+        # stop being selected as stale
+        for paper, summary in zip(summary_papers, summary_results):
+            paper.summary = summary if paper.abstract else None
+            paper.summary_version = MLService.SUMMARY_VERSION
+
+        for paper, sentiment in zip(sentiment_papers, sentiment_results):
+            paper.sentiment_score = sentiment["score"] if paper.abstract else None
+            paper.sentiment_version = MLService.SENTIMENT_VERSION
+
+        for paper, complexity in zip(complexity_papers, complexity_results):
+            paper.complexity_score = complexity if paper.abstract else None
+            paper.complexity_version = MLService.COMPLEXITY_VERSION
+
+        for paper in papers:
+            paper.is_processed = True
+
+    def _abstracts(self, papers: List[ResearchPaper]) -> List[str]:
+        return [paper.abstract or "" for paper in papers]
+
+    def _load_checkpoint(self) -> int:
+        """Return the last committed paper id, or 0 if there is no matching checkpoint"""
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return 0
+
+        try:
+            with open(self.checkpoint_path) as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable checkpoint: {e}")
+            return 0
+
+        # A checkpoint from a run against other model versions does not apply
+        if checkpoint.get("versions") != self.versions:
+            return 0
+
+        return int(checkpoint.get("last_id", 0))
+
+    def _save_checkpoint(self, last_id: int):
+        if not self.checkpoint_path:
+            return
+
+        # Write then rename so an interruption never leaves a partial checkpoint
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"versions": self.versions, "last_id": last_id}, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _clear_checkpoint(self):
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
@@ -0,0 +1,97 @@
+"""
+Process pool workers for scalable topic modeling.
+
+This module deliberately imports nothing from the rest of 'app', so pool
+processes started with spawn only import this file - not the web app or
+the ML models.
+"""
+
+import re
+import numpy as np
+from collections import Counter
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import HashingVectorizer
+from typing import List, Dict, Tuple
+
+MIN_TEXT_LENGTH = 50
+
+def preprocess_text(text: str) -> str:
+    """Clean and preprocess text for analysis"""
+    if not text:
+        return ""
+
+    # Remove special characters and normalize whitespace
+    text = re.sub(r'[^\w\s\.]', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = text.strip()
+
+    return text
+
+def vectorize_chunk(texts: List[str], n_features: int) -> Tuple[csr_matrix, Dict[int, Tuple[str, int]]]:
+    """Preprocess and hash a chunk of texts into term counts.
+
+    Also returns, for each feature index seen, its most frequent term in the chunk
+    and that term's count, so feature names can be recovered without a second pass.
+    """
+    processed_texts = (preprocess_text(text) for text in texts)
+    processed_texts = [text for text in processed_texts if len(text) > MIN_TEXT_LENGTH]
+
+    # HashingVectorizer cannot transform an empty batch
+    if not processed_texts:
+        return csr_matrix((0, n_features)), {}
+
+    # Analyze each text once; the token lists are then hashed as-is
+    analyzer = HashingVectorizer(stop_words='english', ngram_range=(1, 2)).build_analyzer()
+    documents = [analyzer(text) for text in processed_texts]
+    hasher = HashingVectorizer(
+        n_features=n_features,
+        analyzer=_identity_analyzer,
+        alternate_sign=False,
+        norm=None
+    )
+    counts = hasher.transform(documents)
+
+    term_counts = Counter(term for document in documents for term in document)
+    terms = list(term_counts)
+
+    # Hash each distinct term as its own one-term document to find its index
+    term_indices = hasher.transform([[term] for term in terms]).indices
+
+    feature_terms = {}
+    for term, index in zip(terms, term_indices):
+        index = int(index)
+        if index not in feature_terms or term_counts[term] > feature_terms[index][1]:
+            feature_terms[index] = (term, term_counts[term])
+
+    return counts, feature_terms
+
+def merge_feature_terms(chunk_terms: List[Dict[int, Tuple[str, int]]]) -> Dict[int, str]:
+    """Pick the most frequent term for each feature index across all chunks"""
+    merged: Dict[int, Counter] = {}
+    for feature_terms in chunk_terms:
+        for index, (term, count) in feature_terms.items():
+            merged.setdefault(index, Counter())[term] += count
+
+    return {index: counter.most_common(1)[0][0] for index, counter in merged.items()}
+
+def stack_csr(matrices: List[csr_matrix], n_features: int) -> csr_matrix:
+    """Stack CSR chunks by concatenating their buffers directly, without COO round-trips"""
+    nnz = sum(m.nnz for m in matrices)
+    index_dtype = np.int32 if nnz <= np.iinfo(np.int32).max else np.int64
+
+    data = np.concatenate([m.data for m in matrices])
+    indices = np.concatenate([m.indices for m in matrices]).astype(index_dtype, copy=False)
+
+    # Shift each chunk's row pointers by the number of values before it
+    indptr = np.zeros(sum(m.shape[0] for m in matrices) + 1, dtype=index_dtype)
+    row, offset = 0, 0
+    for m in matrices:
+        indptr[row + 1:row + 1 + m.shape[0]] = m.indptr[1:] + offset
+        row += m.shape[0]
+        offset += m.nnz
+
+    n_rows = len(indptr) - 1
+    return csr_matrix((data, indices, indptr), shape=(n_rows, n_features), copy=False)
+
+def _identity_analyzer(terms: List[str]) -> List[str]:
+    return terms
@@ -0,0 +1,59 @@
+"""
+Gunicorn configuration for running OpenMND in production
+
+    gunicorn -c gunicorn_conf.py app.main:app
+
+The app and its ML models are loaded once in the master process (preload_app)
+and workers are forked from it, so model weights are shared copy-on-write
+rather than loaded once per worker. Each worker is limited to its share of the
+CPU cores so torch/BLAS thread pools and topic modeling's process and joblib
+pools do not oversubscribe the node.
+"""
+
+import gc
+import os
+
+# Do not import from 'app' here - thread limits must be in the environment
+# before numpy and torch are first imported by the preloaded app
+
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+# CPUs this process may run on - in a container this can be fewer than the host's
+available_cpus = len(os.sched_getaffinity(0))
+threads_per_worker = int(os.environ.get(
+    "THREADS_PER_WORKER", max(1, available_cpus // workers)
+))
+
+for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "NUMEXPR_NUM_THREADS"):
+    os.environ.setdefault(var, str(threads_per_worker))
+
+# Topic modeling's process pool and LDA's joblib workers get the same budget
+# (read by app.core.config.Settings); a single process runs without forking
+os.environ.setdefault("TOPIC_PROCESSES", str(threads_per_worker))
+os.environ.setdefault("TOPIC_N_JOBS", str(threads_per_worker))
+
+# Hugging Face tokenizers' own thread pool is not fork-safe
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+# Model loading and warm-up are slow; do not kill workers while they start
+timeout = int(os.environ.get("WORKER_TIMEOUT", 300))
+graceful_timeout = 60
+
+def when_ready(server):
+    # Load the models in the master, after the app is preloaded and before workers fork
+    from app.services.ml_service import get_ml_service
+    get_ml_service()
+
+    # Move everything allocated while preloading into the permanent GC generation,
+    # so collections in the workers do not write to (and un-share) those pages
+    gc.collect()
+    gc.freeze()
+    server.log.info(f"Models preloaded; starting {workers} workers with {threads_per_worker} threads each")
+
+def post_fork(server, worker):
+    import torch
+
+    torch.set_num_threads(threads_per_worker)
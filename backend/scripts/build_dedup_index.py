@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate index build script for OpenMND
+Rebuilds the MinHash LSH index from all stored papers and flags papers
+that are near-duplicates of an earlier one, then rebuilds the co-occurrence
+graph indexes so newly flagged papers stop counting there.
+"""
+
+import sys
+import os
+
+# Add the backend directory to Python path
+# This allows importing from the 'app' package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.insert(0, backend_dir)
+
+try:
+    from app.core.config import settings
+    from app.core.database import SessionLocal
+    from app.services.dedup_service import DeduplicationService
+    from app.services.graph_service import GraphService
+    print("Successfully imported modules")
+except ImportError as e:
+    print(f"Import error: {e}")
+    print(f"Current working directory: {os.getcwd()}")
+    print(f"Backend directory: {backend_dir}")
+    print(f"Python path: {sys.path}")
+    sys.exit(1)
+
+def main():
+    """Main function"""
+    print("Building OpenMND near-duplicate index...")
+    db = SessionLocal()
+    dedup_service = DeduplicationService(
+        settings.DEDUP_INDEX_PATH,
+        settings.DEDUP_NUM_PERM,
+        settings.DEDUP_BANDS,
+        settings.DEDUP_THRESHOLD,
+        settings.DEDUP_MIN_SHINGLES
+    )
+
+    try:
+        flagged = dedup_service.rebuild(db)
+        print(f"Indexed {len(dedup_service.index)} papers, flagged {flagged} near-duplicates")
+
+        GraphService(settings.GRAPH_INDEX_DIR, settings.GRAPH_TOP_K).rebuild(db)
+        print("Rebuilt graph indexes without near-duplicates")
+    except Exception as e:
+        print(f"Error building near-duplicate index: {e}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+    print("Near-duplicate index build complete!")
+
+if __name__ == "__main__":
+    main()
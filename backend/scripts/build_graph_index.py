@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Graph index build script for OpenMND
+Backfills the normalized author and MeSH term tables from the JSON
+columns of existing papers, then rebuilds the co-occurrence indexes.
+"""
+
+import sys
+import os
+
+# Add the backend directory to Python path
+# This allows importing from the 'app' package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.insert(0, backend_dir)
+
+try:
+    from sqlalchemy import select
+    from app.core.config import settings
+    from app.core.database import SessionLocal
+    from app.models.research_paper import ResearchPaper, paper_authors, paper_mesh_terms
+    from app.services.graph_service import GraphService, GraphBatch
+    print("Successfully imported modules")
+except ImportError as e:
+    print(f"Import error: {e}")
+    print(f"Current working directory: {os.getcwd()}")
+    print(f"Backend directory: {backend_dir}")
+    print(f"Python path: {sys.path}")
+    sys.exit(1)
+
+CHUNK_SIZE = 1000
+
+def backfill_links(db, graph_service):
+    """Link non-duplicate papers that have no normalized author or MeSH rows yet"""
+    linked_ids = select(paper_authors.c.paper_id).union(select(paper_mesh_terms.c.paper_id))
+    last_id = 0
+    linked = 0
+
+    while True:
+        papers = db.query(ResearchPaper).filter(
+            ResearchPaper.id > last_id,
+            ResearchPaper.duplicate_of_id.is_(None),
+            ResearchPaper.id.notin_(linked_ids)
+        ).order_by(ResearchPaper.id).limit(CHUNK_SIZE).all()
+
+        if not papers:
+            break
+
+        # The full rebuild below replaces incremental index updates, so the batch is dropped
+        batch = GraphBatch()
+        for paper in papers:
+            graph_service.link_paper(db, paper, paper.authors or [], paper.mesh_terms or [], batch)
+
+        db.commit()
+        last_id = papers[-1].id
+        linked += len(papers)
+        print(f"Linked {linked} papers (last id {last_id})")
+
+def main():
+    """Main function"""
+    print("Building OpenMND graph index...")
+    db = SessionLocal()
+    graph_service = GraphService(settings.GRAPH_INDEX_DIR, settings.GRAPH_TOP_K)
+
+    try:
+        backfill_links(db, graph_service)
+        graph_service.rebuild(db)
+        print(f"Author index: {graph_service.author_index.matrix.nnz} co-author pairs")
+        print(f"MeSH index: {graph_service.mesh_index.matrix.nnz} related term pairs")
+    except Exception as e:
+        print(f"Error building graph index: {e}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+    print("Graph index build complete!")
+
+if __name__ == "__main__":
+    main()
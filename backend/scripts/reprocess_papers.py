@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Reprocessing script for OpenMND
+Re-enriches papers whose summary, sentiment or complexity fields were
+produced by an older model version. Safe to interrupt and re-run.
+"""
+
+import sys
+import os
+import argparse
+
+# Add the backend directory to Python path
+# This allows importing from the 'app' package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(current_dir)
+sys.path.insert(0, backend_dir)
+
+try:
+    from app.core.config import settings
+    from app.core.database import SessionLocal
+    from app.services.ml_service import MLService
+    from app.services.reprocessing_service import ReprocessingService
+    print("Successfully imported modules")
+except ImportError as e:
+    print(f"Import error: {e}")
+    print(f"Current working directory: {os.getcwd()}")
+    print(f"Backend directory: {backend_dir}")
+    print(f"Python path: {sys.path}")
+    sys.exit(1)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Reprocess papers enriched by older model versions")
+    parser.add_argument("--chunk-size", type=int, default=settings.REPROCESS_CHUNK_SIZE,
+                        help="Papers fetched and committed per chunk")
+    parser.add_argument("--batch-size", type=int, default=settings.REPROCESS_BATCH_SIZE,
+                        help="Texts per model inference batch")
+    parser.add_argument("--max-workers", type=int, default=settings.REPROCESS_MAX_WORKERS,
+                        help="Concurrent inference workers")
+    parser.add_argument("--checkpoint", default=settings.REPROCESS_CHECKPOINT_PATH,
+                        help="Checkpoint file used to resume an interrupted run")
+    parser.add_argument("--restart", action="store_true",
+                        help="Ignore any existing checkpoint")
+    parser.add_argument("--count", action="store_true",
+                        help="Only report how many papers are stale")
+    return parser.parse_args()
+
+def main():
+    """Main function"""
+    args = parse_args()
+    db = SessionLocal()
+
+    try:
+        if args.count:
+            # Counting does not need the models, so avoid loading them
+            service = ReprocessingService(ml_service=None)
+            print(f"Stale papers: {service.count_stale(db)}")
+            return
+
+        print("Loading ML models...")
+        service = ReprocessingService(
+            MLService(),
+            chunk_size=args.chunk_size,
+            batch_size=args.batch_size,
+            max_workers=args.max_workers,
+            checkpoint_path=args.checkpoint
+        )
+        print(f"Stale papers: {service.count_stale(db)}")
+        result = service.run(db, resume=not args.restart)
+        print(f"Reprocessing complete! {result['processed']} papers updated.")
+    except Exception as e:
+        print(f"Error reprocessing papers: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
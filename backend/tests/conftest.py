@@ -0,0 +1,24 @@
+import sys
+import os
+
+# Add the backend directory to Python path
+# This allows importing from the 'app' package
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.models.research_paper import Base
+
+@pytest.fixture
+def db(tmp_path):
+    """Session on a fresh SQLite database with all tables created"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'openmnd.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
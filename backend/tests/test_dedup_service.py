@@ -0,0 +1,82 @@
+import numpy as np
+from app.services.dedup_service import DedupBatch, DeduplicationService, MinHashIndex
+
+RILUZOLE = ("Riluzole modestly extends survival in amyotrophic lateral sclerosis, the most "
+            "common form of motor neuron disease, in two randomised placebo controlled trials.")
+EDARAVONE = ("Edaravone slowed the decline in functional rating scale scores over six months "
+             "in a selected population of patients with early amyotrophic lateral sclerosis.")
+
+def _batch(paper_id, signature):
+    batch = DedupBatch()
+    batch.add(paper_id, signature)
+    return batch
+
+def _pair(rng, size, shared):
+    """Two texts of distinct tokens sharing `shared` tokens, and their true Jaccard"""
+    tokens = [f"t{i}" for i in rng.permutation(10 * size)[:2 * size - shared]]
+    a = tokens[:size]
+    b = tokens[:shared] + tokens[size:]
+    return " ".join(a), " ".join(b), shared / (2 * size - shared)
+
+def test_estimated_similarity_tracks_true_jaccard(tmp_path):
+    # Single-token shingles make the true Jaccard exact
+    index = MinHashIndex(str(tmp_path / "minhash.npz"), shingle_size=1)
+    rng = np.random.RandomState(0)
+
+    errors = []
+    for _ in range(200):
+        size = int(rng.randint(50, 300))
+        text_a, text_b, jaccard = _pair(rng, size, int(rng.randint(0, size + 1)))
+        estimate = (index.signature(text_a) == index.signature(text_b)).mean()
+        errors.append(abs(estimate - jaccard))
+
+    assert np.mean(errors) < 0.05
+    assert np.max(errors) < 0.2
+
+def test_find_flags_near_duplicates_only(tmp_path):
+    index = MinHashIndex(str(tmp_path / "minhash.npz"), shingle_size=1, threshold=0.8)
+    rng = np.random.RandomState(1)
+
+    original, near_duplicate, _ = _pair(rng, 200, 190)  # Jaccard ~0.90
+    index.merge(_batch(1, index.signature(original)))
+
+    unrelated_a, unrelated_b, _ = _pair(rng, 200, 50)  # Jaccard ~0.14
+    index.merge(_batch(2, index.signature(unrelated_a)))
+
+    assert index.find(index.signature(near_duplicate))[0] == 1
+    assert index.find(index.signature(unrelated_b)) is None
+
+def test_merge_keeps_papers_from_other_writers(tmp_path):
+    path = str(tmp_path / "minhash.npz")
+    first = MinHashIndex(path)
+    second = MinHashIndex(path)
+
+    first.merge(_batch(1, first.signature(RILUZOLE)))
+    second.merge(_batch(2, second.signature(EDARAVONE)))
+
+    assert sorted(MinHashIndex(path).ids.tolist()) == [1, 2]
+
+def test_interleaved_ingestions_only_persist_their_own_batch(tmp_path):
+    path = str(tmp_path / "minhash.npz")
+    dedup_service = DeduplicationService(path)
+    committed, rolled_back = DedupBatch(), DedupBatch()
+    signature = dedup_service.signature({"abstract": RILUZOLE})
+
+    # Each ingestion sees its own unflushed papers but not the other's
+    dedup_service.add(rolled_back, 2, signature)
+    assert dedup_service.find_duplicate(signature, rolled_back) == (2, 1.0)
+    assert dedup_service.find_duplicate(signature, committed) is None
+
+    dedup_service.add(committed, 1, dedup_service.signature({"abstract": EDARAVONE}))
+    dedup_service.flush(committed)
+    # The other ingestion's transaction rolls back and its batch is dropped
+
+    assert MinHashIndex(path).ids.tolist() == [1]
+    assert dedup_service.find_duplicate(signature) is None
+
+def test_papers_without_a_usable_abstract_are_not_checked(tmp_path):
+    dedup_service = DeduplicationService(str(tmp_path / "minhash.npz"))
+
+    assert dedup_service.signature({"title": "No abstract here", "abstract": None}) is None
+    assert dedup_service.signature({"title": "Erratum", "abstract": "Correction to figure 2."}) is None
+    assert dedup_service.find_duplicate(None) is None
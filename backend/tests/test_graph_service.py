@@ -0,0 +1,89 @@
+from sqlalchemy import Insert
+from sqlalchemy.orm import sessionmaker
+from app.models.research_paper import Author, ResearchPaper
+from app.services.graph_service import CooccurrenceIndex, GraphBatch, GraphService
+
+def test_merge_keeps_updates_from_other_writers(tmp_path):
+    path = str(tmp_path / "cooccurrence.npz")
+    first = CooccurrenceIndex(path)
+    second = CooccurrenceIndex(path)
+
+    first.merge([[1, 2]])
+    second.merge([[2, 3]])
+
+    reader = CooccurrenceIndex(path)
+    assert reader.neighbours(2) == [(1, 1), (3, 1)]
+
+def test_refresh_picks_up_rebuilt_index(tmp_path):
+    path = str(tmp_path / "cooccurrence.npz")
+    server = CooccurrenceIndex(path)
+    server.merge([[1, 2]])
+
+    CooccurrenceIndex(path).rebuild([[1, 2], [1, 2], [4, 5]])
+    server.merge([[5, 6]])
+
+    assert server.neighbours(1) == [(2, 2)]
+    assert server.neighbours(5) == [(4, 1), (6, 1)]
+
+def test_flush_persists_only_its_own_batch(db, tmp_path):
+    graph_service = GraphService(str(tmp_path / "graph"))
+    committed, rolled_back = GraphBatch(), GraphBatch()
+
+    # Two ingestions interleave; the second rolls back after the first flushes
+    first = ResearchPaper(pubmed_id="1", title="Riluzole in ALS")
+    db.add(first)
+    graph_service.link_paper(db, first, ["Smith J", "Jones A"], [], committed)
+    db.commit()
+
+    second = ResearchPaper(pubmed_id="2", title="Edaravone in ALS")
+    db.add(second)
+    graph_service.link_paper(db, second, ["Smith J", "Brown K"], [], rolled_back)
+    graph_service.flush(committed)
+    db.rollback()
+
+    ids = dict(db.query(Author.name, Author.id).all())
+    reader = GraphService(str(tmp_path / "graph"))
+    assert reader.top_collaborators(db, ids["Smith J"]) == [
+        {"id": ids["Jones A"], "name": "Jones A", "count": 1}
+    ]
+
+def test_get_or_create_ids_tolerates_names_inserted_concurrently(db, tmp_path, monkeypatch):
+    graph_service = GraphService(str(tmp_path / "graph"))
+    other = sessionmaker(bind=db.get_bind())()
+    execute = db.execute
+
+    # Another ingestion commits the same author between this one's lookup and insert
+    def execute_after_other_commits(statement, *args, **kwargs):
+        if isinstance(statement, Insert) and not other.query(Author).count():
+            other.add(Author(name="Smith J"))
+            other.commit()
+        return execute(statement, *args, **kwargs)
+
+    monkeypatch.setattr(db, "execute", execute_after_other_commits)
+    ids = graph_service._get_or_create_ids(db, Author, ["Smith J", "Jones A"])
+    db.commit()
+
+    names = dict(db.query(Author.id, Author.name).all())
+    assert [names[author_id] for author_id in ids] == ["Smith J", "Jones A"]
+    assert len(names) == 2
+    other.close()
+
+def test_rebuild_and_author_papers_leave_out_duplicates(db, tmp_path):
+    graph_service = GraphService(str(tmp_path / "graph"))
+    original = ResearchPaper(pubmed_id="1", title="Riluzole in ALS")
+    preprint = ResearchPaper(pubmed_id="2", title="Riluzole in ALS (preprint)")
+    db.add(original)
+    graph_service.link_paper(db, original, ["Smith J", "Jones A"], [], GraphBatch())
+    db.add(preprint)
+    graph_service.link_paper(db, preprint, ["Smith J", "Jones A"], [], GraphBatch())
+
+    # A dedup rebuild flags the already linked preprint
+    preprint.duplicate_of_id = original.id
+    db.commit()
+    graph_service.rebuild(db)
+
+    ids = dict(db.query(Author.name, Author.id).all())
+    assert graph_service.top_collaborators(db, ids["Smith J"]) == [
+        {"id": ids["Jones A"], "name": "Jones A", "count": 1}
+    ]
+    assert [paper.id for paper in graph_service.author_papers(db, ids["Smith J"])] == [original.id]
@@ -0,0 +1,31 @@
+from types import SimpleNamespace
+from fastapi.testclient import TestClient
+import app.main
+
+def _client(monkeypatch, ml_service):
+    monkeypatch.setattr(app.main, "get_ml_service", lambda load=True: ml_service)
+    # Not used as a context manager, so the startup warm-up does not run
+    return TestClient(app.main.app)
+
+def test_health_is_unavailable_before_models_are_loaded(monkeypatch):
+    response = _client(monkeypatch, None).get("/health")
+
+    assert response.status_code == 503
+    assert response.json()["models_warm"] is False
+
+def test_health_is_unavailable_while_models_warm_up(monkeypatch):
+    response = _client(monkeypatch, SimpleNamespace(is_warm=False)).get("/health")
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "warming"
+
+def test_health_is_ready_once_models_are_warm(monkeypatch):
+    ml_service = SimpleNamespace(is_warm=False)
+    client = _client(monkeypatch, ml_service)
+    assert client.get("/health").status_code == 503
+
+    ml_service.is_warm = True
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready", "models_warm": True, "pid": response.json()["pid"]}
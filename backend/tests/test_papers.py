@@ -0,0 +1,34 @@
+from app.api.api_v1.endpoints.papers import enrich_paper
+from app.models.research_paper import ResearchPaper
+from app.services.ml_service import MLService
+
+class FailingSummarizer:
+    """MLService stand-in whose summarizer fails while the other models work"""
+
+    def generate_summaries(self, texts, batch_size=16):
+        raise RuntimeError("CUDA out of memory")
+
+    def analyze_sentiments(self, texts, batch_size=16):
+        return [{"score": 7, "label": "positive"} for _ in texts]
+
+    def calculate_complexity_scores(self, texts, batch_size=16):
+        return [4 for _ in texts]
+
+def test_enrich_paper_stamps_only_fields_whose_inference_succeeded():
+    paper = ResearchPaper(pubmed_id="1", title="Riluzole in ALS",
+                          abstract="Riluzole modestly extends survival in ALS.")
+
+    enrich_paper(FailingSummarizer(), paper)
+
+    assert (paper.summary, paper.summary_version) == (None, None)
+    assert (paper.sentiment_score, paper.sentiment_version) == (7, MLService.SENTIMENT_VERSION)
+    assert (paper.complexity_score, paper.complexity_version) == (4, MLService.COMPLEXITY_VERSION)
+
+def test_enrich_paper_stamps_papers_without_abstract():
+    paper = ResearchPaper(pubmed_id="1", title="Riluzole in ALS", abstract=None)
+
+    enrich_paper(FailingSummarizer(), paper)
+
+    assert paper.summary is None
+    assert paper.summary_version == MLService.SUMMARY_VERSION
+    assert paper.is_processed
@@ -0,0 +1,119 @@
+import json
+import pytest
+from app.models.research_paper import ResearchPaper
+from app.services.ml_service import MLService
+from app.services.reprocessing_service import ReprocessingService
+
+ABSTRACT = "Riluzole modestly extends survival in amyotrophic lateral sclerosis."
+
+class FakeMLService:
+    """Batch inference methods of MLService that record their inputs and can fail"""
+
+    def __init__(self):
+        self.calls = {"summary": [], "sentiment": [], "complexity": []}
+        self.fail_after = None  # Number of successful summary batches before raising
+
+    def generate_summaries(self, texts, batch_size=16):
+        if self.fail_after is not None and len(self.calls["summary"]) >= self.fail_after:
+            raise RuntimeError("CUDA out of memory")
+        self.calls["summary"].append(list(texts))
+        return [f"summary: {text}" for text in texts]
+
+    def analyze_sentiments(self, texts, batch_size=16):
+        self.calls["sentiment"].append(list(texts))
+        return [{"score": 7, "label": "positive"} for _ in texts]
+
+    def calculate_complexity_scores(self, texts, batch_size=16):
+        self.calls["complexity"].append(list(texts))
+        return [4 for _ in texts]
+
+def _paper(db, pubmed_id, abstract=ABSTRACT, **fields):
+    paper = ResearchPaper(pubmed_id=pubmed_id, title=f"Paper {pubmed_id}", abstract=abstract, **fields)
+    db.add(paper)
+    db.commit()
+    return paper
+
+def _current(**overrides):
+    versions = {
+        "summary_version": MLService.SUMMARY_VERSION,
+        "sentiment_version": MLService.SENTIMENT_VERSION,
+        "complexity_version": MLService.COMPLEXITY_VERSION
+    }
+    versions.update(overrides)
+    return versions
+
+def test_only_papers_with_outdated_versions_are_stale(db):
+    _paper(db, "1", **_current())
+    _paper(db, "2", **_current(summary_version="bart-large-cnn-v0"))
+    _paper(db, "3")
+    _paper(db, "4", duplicate_of_id=1)
+
+    service = ReprocessingService(FakeMLService())
+
+    assert service.count_stale(db) == 2
+    assert service.run(db)["processed"] == 2
+    assert service.count_stale(db) == 0
+
+def test_only_stale_fields_are_reprocessed_and_stamped(db):
+    paper = _paper(db, "1", sentiment_score=2, complexity_score=9,
+                   **_current(summary_version="bart-large-cnn-v0"))
+    ml_service = FakeMLService()
+
+    ReprocessingService(ml_service).run(db)
+    db.refresh(paper)
+
+    assert ml_service.calls["summary"] == [[ABSTRACT]]
+    assert ml_service.calls["sentiment"] == [[]]
+    assert ml_service.calls["complexity"] == [[]]
+    assert paper.summary == f"summary: {ABSTRACT}"
+    assert (paper.sentiment_score, paper.complexity_score) == (2, 9)
+    assert paper.summary_version == MLService.SUMMARY_VERSION
+
+def test_papers_without_abstract_are_stamped_with_empty_fields(db):
+    paper = _paper(db, "1", abstract=None)
+
+    ReprocessingService(FakeMLService()).run(db)
+    db.refresh(paper)
+
+    assert (paper.summary, paper.sentiment_score, paper.complexity_score) == (None, None, None)
+    assert (paper.summary_version, paper.sentiment_version, paper.complexity_version) == (
+        MLService.SUMMARY_VERSION, MLService.SENTIMENT_VERSION, MLService.COMPLEXITY_VERSION
+    )
+    assert paper.is_processed
+
+def test_failed_chunk_is_rolled_back_and_not_checkpointed(db, tmp_path):
+    checkpoint_path = tmp_path / "checkpoint.json"
+    papers = [_paper(db, str(i)) for i in range(1, 5)]
+    ml_service = FakeMLService()
+    ml_service.fail_after = 1
+
+    service = ReprocessingService(ml_service, chunk_size=2, checkpoint_path=str(checkpoint_path))
+    with pytest.raises(RuntimeError):
+        service.run(db)
+
+    for paper in papers:
+        db.refresh(paper)
+    assert [paper.summary_version for paper in papers] == [MLService.SUMMARY_VERSION] * 2 + [None] * 2
+    assert [paper.sentiment_version for paper in papers] == [MLService.SENTIMENT_VERSION] * 2 + [None] * 2
+    assert papers[2].sentiment_score is None
+    assert json.loads(checkpoint_path.read_text())["last_id"] == papers[1].id
+
+def test_rerun_resumes_from_checkpoint(db, tmp_path):
+    checkpoint_path = tmp_path / "checkpoint.json"
+    papers = [_paper(db, str(i)) for i in range(1, 5)]
+    ml_service = FakeMLService()
+    ml_service.fail_after = 1
+
+    with pytest.raises(RuntimeError):
+        ReprocessingService(ml_service, chunk_size=2, checkpoint_path=str(checkpoint_path)).run(db)
+
+    # Make the already committed chunk look stale again: a resumed run must not revisit it
+    papers[0].summary_version = None
+    db.commit()
+
+    ml_service = FakeMLService()
+    result = ReprocessingService(ml_service, chunk_size=2, checkpoint_path=str(checkpoint_path)).run(db)
+
+    assert result == {"processed": 2, "last_id": papers[3].id}
+    assert ml_service.calls["summary"] == [[ABSTRACT, ABSTRACT]]
+    assert not checkpoint_path.exists()
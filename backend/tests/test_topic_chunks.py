@@ -0,0 +1,48 @@
+from sklearn.feature_extraction.text import HashingVectorizer
+from app.services.topic_chunks import vectorize_chunk, merge_feature_terms, stack_csr
+
+N_FEATURES = 2 ** 10
+
+ABSTRACT = ("Riluzole modestly extends survival in amyotrophic lateral sclerosis, "
+            "the most common form of motor neuron disease, in randomised trials.")
+
+def test_vectorize_chunk_with_no_usable_text_returns_empty_matrix():
+    matrix, feature_terms = vectorize_chunk(["", "too short", None], N_FEATURES)
+
+    assert matrix.shape == (0, N_FEATURES)
+    assert matrix.nnz == 0
+    assert feature_terms == {}
+
+def test_vectorize_chunk_matches_hashing_vectorizer():
+    matrix, _ = vectorize_chunk([ABSTRACT], N_FEATURES)
+    expected = HashingVectorizer(
+        n_features=N_FEATURES,
+        stop_words='english',
+        ngram_range=(1, 2),
+        alternate_sign=False,
+        norm=None
+    ).transform([ABSTRACT.replace(",", " ")])
+
+    assert (matrix != expected).nnz == 0
+
+def test_feature_terms_name_hashed_features():
+    _, first = vectorize_chunk([ABSTRACT, ABSTRACT], N_FEATURES)
+    _, second = vectorize_chunk([ABSTRACT], N_FEATURES)
+    feature_names = merge_feature_terms([first, second])
+
+    matrix, _ = vectorize_chunk(["Riluzole riluzole riluzole and nothing much else worth counting here"],
+                                N_FEATURES)
+    top_index = int(matrix.indices[matrix.data.argmax()])
+    assert feature_names[top_index] == "riluzole"
+
+def test_stack_csr_keeps_rows_of_non_empty_chunks():
+    chunks = [
+        vectorize_chunk([ABSTRACT, ABSTRACT], N_FEATURES)[0],
+        vectorize_chunk([""], N_FEATURES)[0],
+        vectorize_chunk([ABSTRACT], N_FEATURES)[0]
+    ]
+
+    stacked = stack_csr(chunks, N_FEATURES)
+
+    assert stacked.shape == (3, N_FEATURES)
+    assert (stacked[2] != chunks[0][0]).nnz == 0